@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import cached_property, lru_cache
+from typing import Any, Final
 
 from petkit_api.model import Feeder, LitterBox, Fountain
 
@@ -11,7 +12,8 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -19,6 +21,20 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, FEEDERS, LITTER_BOXES, PETKIT_COORDINATOR, WATER_FOUNTAINS
 from .coordinator import PetKitDataUpdateCoordinator
 
+_PURA_TYPES = frozenset({"t3", "t4", "t6"})
+
+# Icons for binary sensors with an (off, on) icon pair
+_ICON_CANCEL: Final = "mdi:cancel"
+_ICON_CCTV: Final = "mdi:cctv"
+_ICON_CCTV_OFF: Final = "mdi:cctv-off"
+_ICON_CHECK_CIRCLE: Final = "mdi:check-circle"
+_ICON_FOOD: Final = "mdi:food-drumstick"
+_ICON_FOOD_OFF: Final = "mdi:food-drumstick-off"
+_ICON_INBOX: Final = "mdi:inbox"
+_ICON_INBOX_REMOVE: Final = "mdi:inbox-remove"
+_ICON_WATER: Final = "mdi:water"
+_ICON_WATER_ALERT: Final = "mdi:water-alert"
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -29,54 +45,25 @@ async def async_setup_entry(
         PETKIT_COORDINATOR
     ]
 
-    binary_sensors = []
-
-    for wf_id, wf_data in coordinator.data.water_fountains.items():
-        # Water Fountains (W5)
-        binary_sensors.append(WFWater(coordinator, wf_id))
-        if wf_data.type == "ctw3":
-            binary_sensors.extend(
-                (WFElectricStatus(coordinator, wf_id), WFPumpStatus(coordinator, wf_id))
-            )
-
-    for feeder_id, feeder_data in coordinator.data.feeders.items():
-
-        # All feeders except D4s
-        if feeder_data.type not in ["d4s", "d4sh"]:
-            binary_sensors.append(FoodLevel(coordinator, feeder_id))
-
-        # D4 and D4s feeders
-        if feeder_data.type in ["d4", "d4s", "d4sh"]:
-            binary_sensors.append(BatteryInstalled(coordinator, feeder_id))
-
-        # D4s Feeder
-        if feeder_data.type in ["d4s", "d4sh"]:
-            binary_sensors.extend(
-                (
-                    FoodLevelHopper1(coordinator, feeder_id),
-                    FoodLevelHopper2(coordinator, feeder_id),
-                )
-            )
-
-        # D4sh Feeder
-        if feeder_data.type == "d4sh":
-            binary_sensors.extend(
-                (
-                    CameraStatus(coordinator, feeder_id),
-                    Eating(coordinator, feeder_id),
-                    Feeding(coordinator, feeder_id),
-                    CarePlusSubscription(coordinator, feeder_id),
-                )
-            )
-
-        # D3 Feeder
-        if feeder_data.type == "d3":
-            binary_sensors.append(BatteryCharging(coordinator, feeder_id))
+    # Water Fountains and Feeders
+    binary_sensors = [
+        entity_cls(coordinator, wf_id)
+        for wf_id, wf_data in coordinator.data.water_fountains.items()
+        for entity_cls in _FOUNTAIN_ENTITIES.get(wf_data.type, (WFWater,))
+    ]
+    binary_sensors.extend(
+        entity_cls(coordinator, feeder_id)
+        for feeder_id, feeder_data in coordinator.data.feeders.items()
+        for entity_cls in _FEEDER_ENTITIES.get(feeder_data.type, (FoodLevel,))
+    )
 
     # Litter boxes
     for lb_id, lb_data in coordinator.data.litter_boxes.items():
+        lb_type = lb_data.type
+        device_detail = lb_data.device_detail
+
         # Pura X & Pura MAX
-        if lb_data.type in ["t3", "t4", "t6"]:
+        if lb_type in _PURA_TYPES:
             binary_sensors.extend(
                 (
                     LBBinFull(coordinator, lb_id),
@@ -84,506 +71,289 @@ async def async_setup_entry(
                 )
             )
         # Pura X & Pura MAX with Pura Air
-        if (lb_data.type == "t3") or ("k3Device" in lb_data.device_detail):
+        if lb_type == "t3" or "k3Device" in device_detail:
             binary_sensors.append(LBDeodorizerLack(coordinator, lb_id))
         # Pura X
-        if lb_data.type == "t3":
+        if lb_type == "t3":
             binary_sensors.append(LBManuallyPaused(coordinator, lb_id))
 
         # Pura MAX2 and Purobot ULTRA
-        if "boxState" in lb_data.device_detail["state"]:
+        if "boxState" in device_detail.get("state", {}):
             binary_sensors.append(LBBWastePresence(coordinator, lb_id))
 
     async_add_entities(binary_sensors)
 
 
-class WFWater(CoordinatorEntity, BinarySensorEntity):
-    """Representation of Water Fountain lack of water warning."""
-
-    def __init__(self, coordinator, wf_id):
-        super().__init__(coordinator)
-        self.wf_id = wf_id
-
-    @property
-    def wf_data(self) -> Fountain:
-        """Handle coordinator Water Fountain data"""
-
-        return self.coordinator.data.water_fountains[self.wf_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.wf_data.id)},
-            "name": self.wf_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": (
-                WATER_FOUNTAINS.get(
-                    self.wf_data.data["typeCode"], "Unidentified Water Fountain"
-                )
-                if "typeCode" in self.wf_data.data
-                else "Unidentified Water Fountain"
-            ),
-            "sw_version": f'{self.wf_data.data["hardware"]}.{self.wf_data.data["firmware"]}',
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.wf_data.id) + "_water_level"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "water_level"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-
-        return BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if water needs to be added."""
-
-        if self.wf_data.data["lackWarning"] == 1:
-            return True
-        else:
-            return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        if self.wf_data.data["lackWarning"] == 1:
-            return "mdi:water-alert"
-        else:
-            return "mdi:water"
-
-
-class FoodLevel(CoordinatorEntity, BinarySensorEntity):
-    """Representation of Feeder lack of food warning."""
-
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
-
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
+@lru_cache(maxsize=256)
+def _fountain_device_info(
+    wf_id: int, name: str, type_code: int | None, hardware: Any, firmware: Any
+) -> DeviceInfo:
+    """Return device registry information shared by a Water Fountain's entities."""
 
-        return self.coordinator.data.feeders[self.feeder_id]
+    return DeviceInfo(
+        identifiers={(DOMAIN, wf_id)},
+        name=name,
+        manufacturer="PetKit",
+        model=WATER_FOUNTAINS.get(type_code, "Unidentified Water Fountain"),
+        sw_version=f"{hardware}.{firmware}",
+    )
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
 
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
+class PetKitBinarySensorBase(
+    CoordinatorEntity[PetKitDataUpdateCoordinator], BinarySensorEntity
+):
+    """Base class for PetKit binary sensors."""
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
+    __slots__ = ()
 
-        return str(self.feeder_data.id) + "_food_level"
+    _attr_should_poll = False
+    _attr_has_entity_name = True
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
+    _UNIQUE_ID_SUFFIX: str
+    # Icons indexed by the entity state: (off, on)
+    _ICONS: tuple[str, str]
 
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "food_level"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-
-        return BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if food needs to be added."""
-
-        if self.feeder_data.type == "d3":
-            if self.feeder_data.data["state"]["food"] < 2:
-                return True
-            else:
-                return False
-
-        if self.feeder_data.type != "d3":
-            # The food key for the Fresh Element represents grams left
-            if self.feeder_data.data["state"]["food"] == 0:
-                return True
-            else:
-                return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        if self.feeder_data.type == "d3":
-            if self.feeder_data.data["state"]["food"] < 2:
-                return "mdi:food-drumstick-off"
-            else:
-                return "mdi:food-drumstick"
-
-        if self.feeder_data.type != "d3":
-            if self.feeder_data.data["state"]["food"] == 0:
-                return "mdi:food-drumstick-off"
-            else:
-                return "mdi:food-drumstick"
-
-
-class BatteryInstalled(CoordinatorEntity, BinarySensorEntity):
-    """Representation of if Feeder has batteries installed."""
-
-    def __init__(self, coordinator, feeder_id):
+    def __init__(self, coordinator, device_id):
         super().__init__(coordinator)
-        self.feeder_id = feeder_id
+        self._attr_unique_id = f"{device_id}_{self._UNIQUE_ID_SUFFIX}"
+        self._update_attrs()
 
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
+    def _update_attrs(self) -> None:
+        """Update entity attributes from coordinator data."""
 
-        return self.coordinator.data.feeders[self.feeder_id]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_battery_installed"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
+class _FountainBinarySensor(PetKitBinarySensorBase):
+    """Base class for Water Fountain binary sensors."""
 
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
+    __slots__ = ("wf_id", "_fountain")
 
-        return "battery_installed"
+    def __init__(self, coordinator, wf_id):
+        self.wf_id = wf_id
+        self._fountain = coordinator.data.water_fountains[wf_id]
+        super().__init__(coordinator, wf_id)
+        data = self._fountain.data
+        self._attr_device_info = _fountain_device_info(
+            wf_id,
+            data["name"],
+            data.get("typeCode"),
+            data["hardware"],
+            data["firmware"],
+        )
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
+    def wf_data(self) -> Fountain:
+        """Handle coordinator Water Fountain data."""
 
-        return EntityCategory.DIAGNOSTIC
+        return self._fountain
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if battery installed."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
 
-        if self.feeder_data.data["state"]["batteryPower"] == 1:
-            return True
-        else:
-            return False
+        # PetKit data is rebuilt on every poll, so refresh the reference
+        self._fountain = self.coordinator.data.water_fountains[self.wf_id]
+        super()._handle_coordinator_update()
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
 
-        return "mdi:battery"
+class _FeederBinarySensor(PetKitBinarySensorBase):
+    """Base class for Feeder binary sensors."""
 
-
-class BatteryCharging(CoordinatorEntity, BinarySensorEntity):
-    """Representation of if Feeder battery is charging."""
+    __slots__ = ("feeder_id", "_feeder")
 
     def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
         self.feeder_id = feeder_id
+        self._feeder = feeder_data = coordinator.data.feeders[feeder_id]
+        super().__init__(coordinator, feeder_id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, feeder_id)},
+            name=feeder_data.data["name"],
+            manufacturer="PetKit",
+            model=FEEDERS[feeder_data.type],
+            sw_version=f'{feeder_data.data["firmware"]}',
+        )
 
     @property
     def feeder_data(self) -> Feeder:
         """Handle coordinator Feeder data."""
 
-        return self.coordinator.data.feeders[self.feeder_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_battery_charging"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
+        return self._feeder
 
-        return "battery"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
 
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-
-        return EntityCategory.DIAGNOSTIC
+        # PetKit data is rebuilt on every poll, so refresh the reference
+        self._feeder = self.coordinator.data.feeders[self.feeder_id]
+        super()._handle_coordinator_update()
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
 
-        return BinarySensorDeviceClass.BATTERY_CHARGING
+class _LitterBoxBinarySensor(PetKitBinarySensorBase):
+    """Base class for litter box binary sensors."""
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if battery is charging."""
-
-        if self.feeder_data.data["state"]["charge"] > 1:
-            return True
-        else:
-            return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        return "mdi:battery"
-
-
-class LBBinFull(CoordinatorEntity, BinarySensorEntity):
-    """Representation of litter box wastebin full or not."""
+    __slots__ = ("lb_id", "_litter_box")
 
     def __init__(self, coordinator, lb_id):
-        super().__init__(coordinator)
         self.lb_id = lb_id
+        self._litter_box = lb_data = coordinator.data.litter_boxes[lb_id]
+        super().__init__(coordinator, lb_id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, lb_id)},
+            name=lb_data.device_detail["name"],
+            manufacturer="PetKit",
+            model=LITTER_BOXES[lb_data.type],
+            sw_version=f'{lb_data.device_detail["firmware"]}',
+        )
 
     @property
     def lb_data(self) -> LitterBox:
         """Handle coordinator litter box data."""
 
-        return self.coordinator.data.litter_boxes[self.lb_id]
+        return self._litter_box
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+    @cached_property
+    def _state(self) -> dict[str, Any]:
+        """Return the litter box state, cached until the next update."""
 
-        return {
-            "identifiers": {(DOMAIN, self.lb_data.id)},
-            "name": self.lb_data.device_detail["name"],
-            "manufacturer": "PetKit",
-            "model": LITTER_BOXES[self.lb_data.type],
-            "sw_version": f'{self.lb_data.device_detail["firmware"]}',
-        }
+        return self.lb_data.device_detail["state"]
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
 
-        return str(self.lb_data.id) + "_wastebin"
+        # PetKit data is rebuilt on every poll, so refresh the reference
+        self._litter_box = self.coordinator.data.litter_boxes[self.lb_id]
+        self.__dict__.pop("_state", None)
+        super()._handle_coordinator_update()
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "wastebin"
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        return "mdi:delete"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-
-        return BinarySensorDeviceClass.PROBLEM
+class WFWater(_FountainBinarySensor):
+    """Representation of Water Fountain lack of water warning."""
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if wastebin is full."""
+    _UNIQUE_ID_SUFFIX = "water_level"
+    _attr_translation_key = "water_level"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-        return self.lb_data.device_detail["state"]["boxFull"]
+    _ICONS = (_ICON_WATER, _ICON_WATER_ALERT)
 
+    def _update_attrs(self) -> None:
+        """Update water warning state and icon from coordinator data."""
 
-class LBLitterLack(CoordinatorEntity, BinarySensorEntity):
-    """Representation of litter box lacking sand."""
+        is_on = self.wf_data.data["lackWarning"] == 1
+        self._attr_is_on = is_on
+        self._attr_icon = self._ICONS[is_on]
 
-    def __init__(self, coordinator, lb_id):
-        super().__init__(coordinator)
-        self.lb_id = lb_id
-
-    @property
-    def lb_data(self) -> LitterBox:
-        """Handle coordinator litter box data."""
 
-        return self.coordinator.data.litter_boxes[self.lb_id]
+class FoodLevel(_FeederBinarySensor):
+    """Representation of Feeder lack of food warning."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+    __slots__ = ("_threshold",)
 
-        return {
-            "identifiers": {(DOMAIN, self.lb_data.id)},
-            "name": self.lb_data.device_detail["name"],
-            "manufacturer": "PetKit",
-            "model": LITTER_BOXES[self.lb_data.type],
-            "sw_version": f'{self.lb_data.device_detail["firmware"]}',
-        }
+    _UNIQUE_ID_SUFFIX = "food_level"
+    _attr_translation_key = "food_level"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
+    _ICONS = (_ICON_FOOD, _ICON_FOOD_OFF)
 
-        return str(self.lb_data.id) + "_litter_lack"
+    def __init__(self, coordinator, feeder_id):
+        # The food key for the Fresh Element represents grams left
+        feeder_type = coordinator.data.feeders[feeder_id].type
+        self._threshold = 2 if feeder_type == "d3" else 1
+        super().__init__(coordinator, feeder_id)
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
+    def _update_attrs(self) -> None:
+        """Update food level state and icon from coordinator data."""
 
-        return True
+        is_on = self.feeder_data.data["state"]["food"] < self._threshold
+        self._attr_is_on = is_on
+        self._attr_icon = self._ICONS[is_on]
 
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
 
-        return "litter"
+class BatteryInstalled(_FeederBinarySensor):
+    """Representation of if Feeder has batteries installed."""
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
+    _UNIQUE_ID_SUFFIX = "battery_installed"
+    _attr_translation_key = "battery_installed"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:battery"
 
-        return "mdi:landslide"
+    def _update_attrs(self) -> None:
+        """Update battery installed state from coordinator data."""
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
+        self._attr_is_on = self.feeder_data.data["state"]["batteryPower"] == 1
 
-        return BinarySensorDeviceClass.PROBLEM
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if litter is empty."""
+class BatteryCharging(_FeederBinarySensor):
+    """Representation of if Feeder battery is charging."""
 
-        return self.lb_data.device_detail["state"]["sandLack"]
+    _UNIQUE_ID_SUFFIX = "battery_charging"
+    _attr_translation_key = "battery"
+    _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:battery"
 
+    def _update_attrs(self) -> None:
+        """Update battery charging state from coordinator data."""
 
-class LBDeodorizerLack(CoordinatorEntity, BinarySensorEntity):
-    """Representation of litter box lacking deodorizer."""
+        self._attr_is_on = self.feeder_data.data["state"]["charge"] > 1
 
-    def __init__(self, coordinator, lb_id):
-        super().__init__(coordinator)
-        self.lb_id = lb_id
 
-    @property
-    def lb_data(self) -> LitterBox:
-        """Handle coordinator litter box data."""
+class LBBinFull(_LitterBoxBinarySensor):
+    """Representation of litter box wastebin full or not."""
 
-        return self.coordinator.data.litter_boxes[self.lb_id]
+    _UNIQUE_ID_SUFFIX = "wastebin"
+    _attr_translation_key = "wastebin"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_icon = "mdi:delete"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+    def _update_attrs(self) -> None:
+        """Update wastebin full state from coordinator data."""
 
-        return {
-            "identifiers": {(DOMAIN, self.lb_data.id)},
-            "name": self.lb_data.device_detail["name"],
-            "manufacturer": "PetKit",
-            "model": LITTER_BOXES[self.lb_data.type],
-            "sw_version": f'{self.lb_data.device_detail["firmware"]}',
-        }
+        self._attr_is_on = self._state["boxFull"]
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
 
-        return str(self.lb_data.id) + "_deodorizer_lack"
+class LBLitterLack(_LitterBoxBinarySensor):
+    """Representation of litter box lacking sand."""
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
+    _UNIQUE_ID_SUFFIX = "litter_lack"
+    _attr_translation_key = "litter"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_icon = "mdi:landslide"
 
-        return True
+    def _update_attrs(self) -> None:
+        """Update litter lack state from coordinator data."""
 
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
+        self._attr_is_on = self._state["sandLack"]
 
-        # Pura Air
-        if "k3Device" in self.lb_data.device_detail:
-            return "pura_air_liquid"
-        # Pura X
-        else:
-            return "deodorizer"
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
+class LBDeodorizerLack(_LitterBoxBinarySensor):
+    """Representation of litter box lacking deodorizer."""
 
-        # Pura Air
-        if "k3Device" in self.lb_data.device_detail:
-            return "mdi:cup"
-        # Pura X
-        else:
-            return "mdi:spray"
+    __slots__ = ("_has_pura_air",)
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
+    _UNIQUE_ID_SUFFIX = "deodorizer_lack"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-        return BinarySensorDeviceClass.PROBLEM
+    def __init__(self, coordinator, lb_id):
+        super().__init__(coordinator, lb_id)
+        # Pura Air or Pura X
+        self._attr_translation_key = (
+            "pura_air_liquid" if self._has_pura_air else "deodorizer"
+        )
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if deodorizer is empty."""
+    def _update_attrs(self) -> None:
+        """Update deodorizer state and icon from coordinator data."""
 
-        return self.lb_data.device_detail["state"]["liquidLack"]
+        # A Pura Air can be paired with the litter box at any time
+        self._has_pura_air = "k3Device" in self.lb_data.device_detail
+        self._attr_is_on = self._state["liquidLack"]
+        self._attr_icon = "mdi:cup" if self._has_pura_air else "mdi:spray"
 
     @property
     def available(self) -> bool:
@@ -593,657 +363,180 @@ class LBDeodorizerLack(CoordinatorEntity, BinarySensorEntity):
         device associated or this is a Pura X.
         """
 
-        if self.lb_data.type == "t4":
-            if "k3Device" in self.lb_data.device_detail:
-                return True
-            else:
-                return False
-        else:
-            return True
+        return self.lb_data.type != "t4" or self._has_pura_air
 
 
-class LBManuallyPaused(CoordinatorEntity, BinarySensorEntity):
+class LBManuallyPaused(_LitterBoxBinarySensor):
     """Representation of if litter box is manually paused by user."""
 
-    def __init__(self, coordinator, lb_id):
-        super().__init__(coordinator)
-        self.lb_id = lb_id
-
-    @property
-    def lb_data(self) -> LitterBox:
-        """Handle coordinator litter box data."""
+    _UNIQUE_ID_SUFFIX = "manually_paused"
+    _attr_translation_key = "manually_paused"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:pause"
 
-        return self.coordinator.data.litter_boxes[self.lb_id]
+    def _update_attrs(self) -> None:
+        """Update manually paused state from coordinator data."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+        self._attr_is_on = self.lb_data.manually_paused
 
-        return {
-            "identifiers": {(DOMAIN, self.lb_data.id)},
-            "name": self.lb_data.device_detail["name"],
-            "manufacturer": "PetKit",
-            "model": LITTER_BOXES[self.lb_data.type],
-            "sw_version": f'{self.lb_data.device_detail["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.lb_data.id) + "_manually_paused"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "manually_paused"
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        return "mdi:pause"
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if deodorizer is empty."""
-
-        return self.lb_data.manually_paused
-
-
-class FoodLevelHopper1(CoordinatorEntity, BinarySensorEntity):
+class FoodLevelHopper1(_FeederBinarySensor):
     """Representation of Feeder lack of food warning for Hopper 1."""
 
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
+    _UNIQUE_ID_SUFFIX = "food_level_hopper_1"
+    _attr_translation_key = "food_level_hopper_one"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
+    _ICONS = (_ICON_FOOD, _ICON_FOOD_OFF)
 
-        return self.coordinator.data.feeders[self.feeder_id]
+    def _update_attrs(self) -> None:
+        """Update hopper 1 food level state and icon from coordinator data."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+        is_on = self.feeder_data.data["state"]["food1"] < 1
+        self._attr_is_on = is_on
+        self._attr_icon = self._ICONS[is_on]
 
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_food_level_hopper_1"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "food_level_hopper_one"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-
-        return BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if food needs to be added."""
-
-        if self.feeder_data.data["state"]["food1"] < 1:
-            return True
-        else:
-            return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        if self.feeder_data.data["state"]["food1"] == 0:
-            return "mdi:food-drumstick-off"
-        else:
-            return "mdi:food-drumstick"
-
-
-class FoodLevelHopper2(CoordinatorEntity, BinarySensorEntity):
+class FoodLevelHopper2(_FeederBinarySensor):
     """Representation of Feeder lack of food warning for Hopper 2."""
 
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
+    _UNIQUE_ID_SUFFIX = "food_level_hopper_2"
+    _attr_translation_key = "food_level_hopper_two"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
+    _ICONS = (_ICON_FOOD, _ICON_FOOD_OFF)
 
-        return self.coordinator.data.feeders[self.feeder_id]
+    def _update_attrs(self) -> None:
+        """Update hopper 2 food level state and icon from coordinator data."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+        is_on = self.feeder_data.data["state"]["food2"] < 1
+        self._attr_is_on = is_on
+        self._attr_icon = self._ICONS[is_on]
 
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_food_level_hopper_2"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "food_level_hopper_two"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-
-        return BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if food needs to be added."""
-
-        if self.feeder_data.data["state"]["food2"] < 1:
-            return True
-        else:
-            return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        if self.feeder_data.data["state"]["food2"] == 0:
-            return "mdi:food-drumstick-off"
-        else:
-            return "mdi:food-drumstick"
-
-
-class CameraStatus(CoordinatorEntity, BinarySensorEntity):
+class CameraStatus(_FeederBinarySensor):
     """Representation of if Feeder has Camera turned ON/OFF"""
 
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
-
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
-
-        return self.coordinator.data.feeders[self.feeder_id]
+    _UNIQUE_ID_SUFFIX = "camera_status"
+    _attr_translation_key = "camera_status"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_camera_status"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
+    _ICONS = (_ICON_CCTV_OFF, _ICON_CCTV)
 
-        return True
+    def _update_attrs(self) -> None:
+        """Update camera state and icon from coordinator data."""
 
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "camera_status"
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if battery installed."""
+        is_on = self.feeder_data.data["state"]["cameraStatus"] == 1
+        self._attr_is_on = is_on
+        self._attr_icon = self._ICONS[is_on]
 
-        if self.feeder_data.data["state"]["cameraStatus"] == 1:
-            return True
-        else:
-            return False
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        if self.feeder_data.data["state"]["cameraStatus"] == 1:
-            return "mdi:cctv"
-        else:
-            return "mdi:cctv-off"
-
-
-class Eating(CoordinatorEntity, BinarySensorEntity):
+class Eating(_FeederBinarySensor):
     """Representation of feeder ????"""
 
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
+    _UNIQUE_ID_SUFFIX = "eating"
+    _attr_translation_key = "eating"
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+    _attr_icon = "mdi:silverware-fork-knife"
 
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
+    def _update_attrs(self) -> None:
+        """Update eating state from coordinator data."""
 
-        return self.coordinator.data.feeders[self.feeder_id]
+        self._attr_is_on = self.feeder_data.data["state"]["eating"] == 1
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_eating"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "eating"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return the type of state class."""
-
-        return BinarySensorDeviceClass.OCCUPANCY
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if food needs to be added."""
-
-        if self.feeder_data.data["state"]["eating"] == 1:
-            return True
-        else:
-            return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        return "mdi:silverware-fork-knife"
-
-
-class Feeding(CoordinatorEntity, BinarySensorEntity):
+class Feeding(_FeederBinarySensor):
     """Representation of feeder ????"""
 
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
-
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
+    _UNIQUE_ID_SUFFIX = "feeding"
+    _attr_translation_key = "feeding"
+    _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
+    _attr_icon = "mdi:shaker-outline"
 
-        return self.coordinator.data.feeders[self.feeder_id]
+    def _update_attrs(self) -> None:
+        """Update feeding state from coordinator data."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+        self._attr_is_on = self.feeder_data.data["state"]["feeding"] == 1
 
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.feeder_data.id) + "_feeding"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "feeding"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return the type of state class."""
-
-        return BinarySensorDeviceClass.OCCUPANCY
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if food needs to be added."""
-
-        if self.feeder_data.data["state"]["feeding"] == 1:
-            return True
-        else:
-            return False
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        return "mdi:shaker-outline"
-
-
-class LBBWastePresence(CoordinatorEntity, BinarySensorEntity):
+class LBBWastePresence(_LitterBoxBinarySensor):
     """Representation of litter box wastebin present or not."""
 
-    def __init__(self, coordinator, lb_id):
-        super().__init__(coordinator)
-        self.lb_id = lb_id
+    _UNIQUE_ID_SUFFIX = "wastebin_presence"
+    _attr_translation_key = "waste_bin_presence"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-    @property
-    def lb_data(self) -> LitterBox:
-        """Handle coordinator litter box data."""
+    _ICONS = (_ICON_INBOX, _ICON_INBOX_REMOVE)
 
-        return self.coordinator.data.litter_boxes[self.lb_id]
+    def _update_attrs(self) -> None:
+        """Update wastebin presence state and icon from coordinator data."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
+        is_on = self._state["boxState"] != 1
+        self._attr_is_on = is_on
+        self._attr_icon = self._ICONS[is_on]
 
-        return {
-            "identifiers": {(DOMAIN, self.lb_data.id)},
-            "name": self.lb_data.device_detail["name"],
-            "manufacturer": "PetKit",
-            "model": LITTER_BOXES[self.lb_data.type],
-            "sw_version": f'{self.lb_data.device_detail["firmware"]}',
-        }
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.lb_data.id) + "_wastebin_presence"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-
-        return "waste_bin_presence"
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-
-        if self.lb_data.device_detail["state"]["boxState"] == 1:
-            return "mdi:inbox"
-        else:
-            return "mdi:inbox-remove"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-
-        return BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if wastebin is present."""
-
-        if self.lb_data.device_detail["state"]["boxState"] == 1:
-            return False
-        else:
-            return True
-
-
-class CarePlusSubscription(CoordinatorEntity, BinarySensorEntity):
+class CarePlusSubscription(_FeederBinarySensor):
     """Representation of Care Plus subscription status."""
 
-    def __init__(self, coordinator, feeder_id):
-        super().__init__(coordinator)
-        self.feeder_id = feeder_id
+    _UNIQUE_ID_SUFFIX = "care_plus_subscription"
+    _attr_translation_key = "care_plus_subscription"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def feeder_data(self) -> Feeder:
-        """Handle coordinator Feeder data."""
-        return self.coordinator.data.feeders[self.feeder_id]
+    _ICONS = (_ICON_CANCEL, _ICON_CHECK_CIRCLE)
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.feeder_data.id)},
-            "name": self.feeder_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": FEEDERS[self.feeder_data.type],
-            "sw_version": f'{self.feeder_data.data["firmware"]}',
-        }
+    def _update_attrs(self) -> None:
+        """Update Care Plus subscription state and icon from coordinator data."""
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return str(self.feeder_data.id) + "_care_plus_subscription"
+        subscribed = self.feeder_data.data["cloudProduct"]["subscribe"] == 1
+        self._attr_is_on = subscribed
+        self._attr_icon = self._ICONS[subscribed]
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-        return "care_plus_subscription"
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if Care Plus subscription is active."""
-        return self.feeder_data.data["cloudProduct"]["subscribe"] == 1
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        if self.feeder_data.data["cloudProduct"]["subscribe"] == 1:
-            return "mdi:check-circle"
-        else:
-            return "mdi:cancel"
-
-
-class WFElectricStatus(CoordinatorEntity, BinarySensorEntity):
+class WFElectricStatus(_FountainBinarySensor):
     """Representation of Water Fountain electric status."""
 
-    def __init__(self, coordinator, wf_id):
-        super().__init__(coordinator)
-        self.wf_id = wf_id
-
-    @property
-    def wf_data(self) -> Fountain:
-        """Handle coordinator Water Fountain data."""
-        return self.coordinator.data.water_fountains[self.wf_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.wf_data.id)},
-            "name": self.wf_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": (
-                WATER_FOUNTAINS.get(
-                    self.wf_data.data["typeCode"], "Unidentified Water Fountain"
-                )
-                if "typeCode" in self.wf_data.data
-                else "Unidentified Water Fountain"
-            ),
-            "sw_version": f'{self.wf_data.data["hardware"]}.{self.wf_data.data["firmware"]}',
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return str(self.wf_data.id) + "_electric_status"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-        return "electric_status"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-        return BinarySensorDeviceClass.POWER
+    _UNIQUE_ID_SUFFIX = "electric_status"
+    _attr_translation_key = "electric_status"
+    _attr_device_class = BinarySensorDeviceClass.POWER
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if the fountain is plugged in."""
-        return self.wf_data.data["status"]["electricStatus"] > 0
+    def _update_attrs(self) -> None:
+        """Update electric status state from coordinator data."""
 
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        if self.is_on:
-            return "mdi:power-plug"
-        else:
-            return "mdi:power-plug-off"
+        status = self.wf_data.data["status"]
+        self._attr_is_on = status["electricStatus"] > 0
 
 
-class WFPumpStatus(CoordinatorEntity, BinarySensorEntity):
+class WFPumpStatus(_FountainBinarySensor):
     """Representation of Water Fountain pump status."""
 
-    def __init__(self, coordinator, wf_id):
-        super().__init__(coordinator)
-        self.wf_id = wf_id
-
-    @property
-    def wf_data(self) -> Fountain:
-        """Handle coordinator Water Fountain data."""
-        return self.coordinator.data.water_fountains[self.wf_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.wf_data.id)},
-            "name": self.wf_data.data["name"],
-            "manufacturer": "PetKit",
-            "model": (
-                WATER_FOUNTAINS.get(
-                    self.wf_data.data["typeCode"], "Unidentified Water Fountain"
-                )
-                if "typeCode" in self.wf_data.data
-                else "Unidentified Water Fountain"
-            ),
-            "sw_version": f'{self.wf_data.data["hardware"]}.{self.wf_data.data["firmware"]}',
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return str(self.wf_data.id) + "_pump_status"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def translation_key(self) -> str:
-        """Translation key for this entity."""
-        return "pump_status"
-
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return entity device class."""
-        return BinarySensorDeviceClass.POWER
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the pump is running."""
-        return self.wf_data.data["status"]["runStatus"] == 1
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        if self.is_on:
-            return "mdi:water-pump"
-        else:
-            return "mdi:water-pump-off"
+    _UNIQUE_ID_SUFFIX = "pump_status"
+    _attr_translation_key = "pump_status"
+    _attr_device_class = BinarySensorDeviceClass.POWER
+
+    def _update_attrs(self) -> None:
+        """Update pump status state from coordinator data."""
+
+        status = self.wf_data.data["status"]
+        self._attr_is_on = status["runStatus"] == 1
+
+
+# Binary sensors created per device type. Water Fountains default to WFWater
+# (W5) and feeders to FoodLevel (Fresh Element and Mini Pro).
+_FOUNTAIN_ENTITIES: dict[str, tuple[type[_FountainBinarySensor], ...]] = {
+    "ctw3": (WFWater, WFElectricStatus, WFPumpStatus),
+}
+_FEEDER_ENTITIES: dict[str, tuple[type[_FeederBinarySensor], ...]] = {
+    "d3": (FoodLevel, BatteryCharging),
+    "d4": (FoodLevel, BatteryInstalled),
+    "d4s": (BatteryInstalled, FoodLevelHopper1, FoodLevelHopper2),
+    "d4sh": (
+        BatteryInstalled,
+        FoodLevelHopper1,
+        FoodLevelHopper2,
+        CameraStatus,
+        Eating,
+        Feeding,
+        CarePlusSubscription,
+    ),
+}
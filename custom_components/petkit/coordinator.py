@@ -43,6 +43,7 @@ class PetKitDataUpdateCoordinator(DataUpdateCoordinator):
                 LOGGER,
                 name=DOMAIN,
                 update_interval=timedelta(seconds=entry.options[POLLING_INTERVAL]),
+                always_update=False,
             )
         except RegionError as error:
             raise ConfigEntryAuthFailed(error) from error
@@ -59,3 +60,14 @@ class PetKitDataUpdateCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(error) from error
         else:
             return data
+
+    async def async_request_refresh(self) -> None:
+        """Push optimistic changes to listeners, then request a refresh.
+
+        Entities mutate the coordinator data in place before requesting a
+        refresh, so the refreshed data may compare equal to it and listeners
+        would otherwise never see the optimistic values.
+        """
+
+        self.async_update_listeners()
+        await super().async_request_refresh()